@@ -21,28 +21,32 @@ async def main():
             StdioClientParameters(server_name="iqa-pytorch"),
         )
 
+        # The requests below are independent, so issue them concurrently
+        resources, content, search_result, usage_result = await asyncio.gather(
+            client.list_resources(),
+            client.read_resource(AnyUrl("iqa://models/all")),
+            client.call_tool("search_models", {"query": "ssim"}),
+            client.call_tool("get_usage_example", {"model_name": "ssim"}),
+        )
+
         # List all available resources
-        resources = await client.list_resources()
         print("\nAvailable Resources:")
         for resource in resources:
             print(f"- {resource.name}: {resource.uri}")
 
         # Get all IQA models
-        content = await client.read_resource(AnyUrl("iqa://models/all"))
         models = json.loads(content)
         print("\nTotal number of models:", sum(len(category) for category in models.values()))
 
         # Search for SSIM-related models
-        result = await client.call_tool("search_models", {"query": "ssim"})
         print("\nSSIM-related models:")
-        ssim_models = json.loads(result[0].text)
+        ssim_models = json.loads(search_result[0].text)
         for model in ssim_models:
             print(f"- {model['key']}: {model['info']['description']}")
 
         # Get usage example for SSIM
-        result = await client.call_tool("get_usage_example", {"model_name": "ssim"})
         print("\nSSIM Usage Example:")
-        print(result[0].text)
+        print(usage_result[0].text)
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,31 @@
+"""
+IQA Server JSON Module
+
+Contains the JSON encoder used for server responses, backed by orjson when
+it is installed and by the standard library otherwise.
+"""
+
+from types import MappingProxyType
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+    import json
+
+def _default(obj: Any) -> Any:
+    """Convert read-only mappings (e.g. the frozen model database) to dicts."""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps(obj: Any) -> str:
+    """Serialize an object to a compact JSON string.
+
+    Non-ASCII characters are written as raw UTF-8 by both backends, so the
+    output does not depend on whether orjson is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default)
@@ -4,7 +4,27 @@ IQA Model Database Module
 Contains the definition of IQA models and their metadata.
 """
 
-from typing import Dict, Any, List
+import sys
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Tuple
+
+from .constants import (
+    KEY_FR_METHODS,
+    KEY_NR_METHODS,
+    KEY_SPECIFIC_METHODS,
+    MODEL_TYPE_ALL,
+    MODEL_TYPE_FR,
+    MODEL_TYPE_NR,
+    MODEL_TYPE_SPECIFIC,
+)
+
+# Model type filter -> database categories it covers
+_CATEGORIES_BY_TYPE: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    MODEL_TYPE_ALL: (KEY_FR_METHODS, KEY_NR_METHODS, KEY_SPECIFIC_METHODS),
+    MODEL_TYPE_FR: (KEY_FR_METHODS,),
+    MODEL_TYPE_NR: (KEY_NR_METHODS,),
+    MODEL_TYPE_SPECIFIC: (KEY_SPECIFIC_METHODS,),
+})
 
 class IQAModelDatabase:
     """Manages the database of IQA models and their metadata."""
@@ -43,20 +63,74 @@ class IQAModelDatabase:
                 # ...existing specific_methods...
             }
         }
+        self._freeze_models()
+        self._build_indexes()
+    
+    def _freeze_models(self):
+        """Intern repeated metadata strings and make the database read-only."""
+        for category_models in self.models.values():
+            for model_info in category_models.values():
+                for key in ("type", "category"):
+                    if key in model_info:
+                        model_info[key] = sys.intern(model_info[key])
+                model_info["names"] = tuple(model_info["names"])
+        
+        self.models = MappingProxyType({
+            category: MappingProxyType({
+                model_key: MappingProxyType(model_info)
+                for model_key, model_info in category_models.items()
+            })
+            for category, category_models in self.models.items()
+        })
     
-    def get_all_models(self) -> Dict[str, Any]:
+    def _build_indexes(self):
+        """Precompute the lookup tables used by search, model info and name listing queries."""
+        # Lowercased alias/key -> model info
+        name_to_info: Dict[str, Mapping[str, Any]] = {}
+        # Category -> parallel (model keys, lowercased search texts, model infos)
+        search_columns: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[Mapping[str, Any], ...]]] = {}
+        
+        for category in _CATEGORIES_BY_TYPE[MODEL_TYPE_ALL]:
+            category_models = self.models[category]
+            search_texts = []
+            for model_key, model_info in category_models.items():
+                search_texts.append(f"{' '.join(model_info['names'])} {model_info['description']} {model_info.get('category', '')}".lower())
+                for name in model_info["names"]:
+                    name_to_info.setdefault(name.lower(), model_info)
+                name_to_info.setdefault(model_key.lower(), model_info)
+            search_columns[category] = (
+                tuple(category_models.keys()),
+                tuple(search_texts),
+                tuple(category_models.values()),
+            )
+        
+        # Model type -> sorted model names
+        names_by_category = {
+            category: [name for model_info in self.models[category].values() for name in model_info["names"]]
+            for category in _CATEGORIES_BY_TYPE[MODEL_TYPE_ALL]
+        }
+        sorted_names = {
+            model_type: tuple(sorted(name for category in categories for name in names_by_category[category]))
+            for model_type, categories in _CATEGORIES_BY_TYPE.items()
+        }
+        
+        self._name_to_info = MappingProxyType(name_to_info)
+        self._search_columns = MappingProxyType(search_columns)
+        self._sorted_names = MappingProxyType(sorted_names)
+    
+    def get_all_models(self) -> Mapping[str, Any]:
         """Get all models in the database."""
         return self.models
     
-    def get_fr_models(self) -> Dict[str, Any]:
+    def get_fr_models(self) -> Mapping[str, Any]:
         """Get Full Reference (FR) models."""
         return self.models["fr_methods"]
     
-    def get_nr_models(self) -> Dict[str, Any]:
+    def get_nr_models(self) -> Mapping[str, Any]:
         """Get No Reference (NR) models."""
         return self.models["nr_methods"]
     
-    def get_specific_models(self) -> Dict[str, Any]:
+    def get_specific_models(self) -> Mapping[str, Any]:
         """Get task-specific models."""
         return self.models["specific_methods"]
     
@@ -65,57 +139,24 @@ class IQAModelDatabase:
         query = query.lower()
         results = []
         
-        categories = []
-        if model_type == "all":
-            categories = ["fr_methods", "nr_methods", "specific_methods"]
-        elif model_type == "FR":
-            categories = ["fr_methods"]
-        elif model_type == "NR":
-            categories = ["nr_methods"]
-        elif model_type == "Specific":
-            categories = ["specific_methods"]
-            
-        for category in categories:
-            for model_key, model_info in self.models[category].items():
-                search_text = f"{' '.join(model_info['names'])} {model_info['description']} {model_info.get('category', '')}".lower()
+        for category in _CATEGORIES_BY_TYPE.get(model_type, ()):
+            model_keys, search_texts, model_infos = self._search_columns[category]
+            for i, search_text in enumerate(search_texts):
                 if query in search_text:
                     results.append({
-                        "key": model_key,
-                        "info": model_info
+                        "key": model_keys[i],
+                        "info": model_infos[i]
                     })
         
         return results
     
-    def get_model_info(self, model_name: str) -> Dict[str, Any]:
+    def get_model_info(self, model_name: str) -> Mapping[str, Any]:
         """Get detailed information about a specific model."""
-        model_name = model_name.lower()
-        
-        for category in ["fr_methods", "nr_methods", "specific_methods"]:
-            for model_key, model_info in self.models[category].items():
-                if model_name in [name.lower() for name in model_info["names"]] or model_name == model_key.lower():
-                    return model_info
-        
-        return {}
+        return self._name_to_info.get(model_name.lower(), {})
     
     def list_model_names(self, model_type: str = "all") -> List[str]:
         """Get all available model names."""
-        all_names = []
-        categories = []
-        
-        if model_type == "all":
-            categories = ["fr_methods", "nr_methods", "specific_methods"]
-        elif model_type == "FR":
-            categories = ["fr_methods"]
-        elif model_type == "NR":
-            categories = ["nr_methods"]
-        elif model_type == "Specific":
-            categories = ["specific_methods"]
-            
-        for category in categories:
-            for model_info in self.models[category].values():
-                all_names.extend(model_info["names"])
-                
-        return sorted(all_names)
+        return list(self._sorted_names.get(model_type, ()))
 
 # Initialize the global model database
 model_database = IQAModelDatabase()
@@ -4,12 +4,13 @@ IQA MCP Server Module
 Implements the Model Context Protocol server for IQA model information.
 """
 
-import json
 from typing import Dict, List, Any
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 import mcp.types as types
 
+from . import _json
+from .constants import MODEL_TYPES, RESOURCE_URIS
 from .models import model_database
 from .utils import format_model_info, generate_model_comparison, format_search_results, generate_usage_example
 
@@ -22,6 +23,18 @@ class IQAServer:
         self.generate_model_comparison = generate_model_comparison
         self.format_search_results = format_search_results
         self.generate_usage_example = generate_usage_example
+        
+        # The model database is static, so serialize its payloads once up front
+        self._resource_cache = {
+            RESOURCE_URIS["all"]: _json.dumps(model_database.get_all_models()),
+            RESOURCE_URIS["fr"]: _json.dumps(model_database.get_fr_models()),
+            RESOURCE_URIS["nr"]: _json.dumps(model_database.get_nr_models()),
+            RESOURCE_URIS["specific"]: _json.dumps(model_database.get_specific_models()),
+        }
+        self._model_names_cache = {
+            model_type: _json.dumps(model_database.list_model_names(model_type))
+            for model_type in MODEL_TYPES
+        }
         self._setup_handlers()
     
     def _setup_handlers(self):
@@ -62,16 +75,9 @@ class IQAServer:
             """Read IQA model information based on URI."""
             uri_str = str(uri)
             
-            if uri_str == "iqa://models/all":
-                return json.dumps(model_database.get_all_models(), indent=2)
-            elif uri_str == "iqa://models/fr":
-                return json.dumps(model_database.get_fr_models(), indent=2)
-            elif uri_str == "iqa://models/nr":
-                return json.dumps(model_database.get_nr_models(), indent=2)
-            elif uri_str == "iqa://models/specific":
-                return json.dumps(model_database.get_specific_models(), indent=2)
-            else:
-                raise ValueError(f"Unknown resource URI: {uri}")
+            if uri_str in self._resource_cache:
+                return self._resource_cache[uri_str]
+            raise ValueError(f"Unknown resource URI: {uri}")
         
         @self.server.list_tools()
         async def handle_list_tools() -> list[types.Tool]:
@@ -170,10 +176,12 @@ class IQAServer:
             
             elif name == "list_model_names":
                 model_type = arguments.get("model_type", "all")
-                names = model_database.list_model_names(model_type)
+                names_json = self._model_names_cache.get(model_type)
+                if names_json is None:
+                    names_json = _json.dumps(model_database.list_model_names(model_type))
                 return [types.TextContent(
                     type="text",
-                    text=json.dumps(names, indent=2)
+                    text=names_json
                 )]
             
             elif name == "get_usage_example":
@@ -85,28 +85,42 @@ def format_search_results(results: list[Dict[str, Any]], compact: bool = False)
     
     return "\n".join(formatted)
 
+# Usage example templates, pre-split on the model name placeholder so that
+# generating an example is a single str.join per call
+_USAGE_MODEL_PLACEHOLDER = "{model_name}"
+
+_USAGE_HEADER = """# Basic usage example for {model_name}
+import pyiqa
+
+# Create the metric
+metric = pyiqa.create_metric('{model_name}')
+
+# Get score range (if available)
+try:
+    print(f"Score range for {model_name}: {metric.score_range}")
+except:
+    print("Score range not available for this metric")
+"""
+
+_USAGE_FR_FOOTER = """
+# For Full Reference methods:
+score = metric(img_test, img_ref)
+
+# For batch processing:
+scores = metric(batch_test, batch_ref)"""
+
+_USAGE_NR_FOOTER = """
+# For No Reference methods:
+score = metric(img_test)
+
+# For batch processing:
+scores = metric(batch_imgs)"""
+
+_USAGE_FR_PARTS = tuple((_USAGE_HEADER + _USAGE_FR_FOOTER).split(_USAGE_MODEL_PLACEHOLDER))
+_USAGE_NR_PARTS = tuple((_USAGE_HEADER + _USAGE_NR_FOOTER).split(_USAGE_MODEL_PLACEHOLDER))
+
 def generate_usage_example(model_name: str, model_info: Optional[Dict[str, Any]] = None) -> str:
     """Generate a usage example for a specific model."""
-    example = [f"# Basic usage example for {model_name}"]
-    example.append("import pyiqa")
-    example.append(f"\n# Create the metric")
-    example.append(f"metric = pyiqa.create_metric('{model_name}')")
-    
-    example.append(f"\n# Get score range (if available)")
-    example.append("try:")
-    example.append(f"    print(f\"Score range for {model_name}: {{metric.score_range}}\")")
-    example.append("except:")
-    example.append("    print(\"Score range not available for this metric\")")
-    
     if model_info and model_info["type"] == "FR":
-        example.append(f"\n# For Full Reference methods:")
-        example.append("score = metric(img_test, img_ref)")
-        example.append("\n# For batch processing:")
-        example.append("scores = metric(batch_test, batch_ref)")
-    else:
-        example.append(f"\n# For No Reference methods:")
-        example.append("score = metric(img_test)")
-        example.append("\n# For batch processing:")
-        example.append("scores = metric(batch_imgs)")
-    
-    return "\n".join(example)
+        return model_name.join(_USAGE_FR_PARTS)
+    return model_name.join(_USAGE_NR_PARTS)
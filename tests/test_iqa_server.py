@@ -6,12 +6,12 @@ Tests for the IQA MCP Server
 import json
 import pytest
 from mcp.types import AnyUrl, Resource, TextContent
-from iqa_server import IQAServer
+from iqa_server import IQAServer, _json
 from iqa_server.models import model_database
 
-@pytest.fixture
-async def server():
-    """Create a server instance for testing."""
+@pytest.fixture(scope="module")
+def server():
+    """Create a single server instance shared by the module's tests."""
     return IQAServer()
 
 class TestModelDatabase:
@@ -24,6 +24,26 @@ class TestModelDatabase:
         assert "nr_methods" in models
         assert "specific_methods" in models
     
+    def test_models_are_read_only(self):
+        """Test that the model getters cannot be mutated by callers."""
+        with pytest.raises(TypeError):
+            model_database.get_all_models()["fr_methods"] = {}
+        with pytest.raises(TypeError):
+            model_database.get_fr_models()["new_model"] = {}
+        with pytest.raises(TypeError):
+            model_database.get_model_info("qalign")["description"] = ""
+        with pytest.raises(AttributeError):
+            model_database.get_model_info("topiq_fr")["names"].append("new_name")
+    
+    def test_models_json_serializable(self):
+        """Test that the read-only models serialize like plain dicts."""
+        models = model_database.get_all_models()
+        plain_models = {
+            category: {key: {**info, "names": list(info["names"])} for key, info in category_models.items()}
+            for category, category_models in models.items()
+        }
+        assert json.loads(_json.dumps(models)) == plain_models
+    
     def test_get_fr_models(self):
         """Test retrieving FR models."""
         fr_models = model_database.get_fr_models()
@@ -78,6 +98,55 @@ class TestModelDatabase:
         # Test sorting
         assert fr_names == sorted(fr_names)
 
+def _validate_search_by_name(result):
+    assert len(result) == 1
+    assert isinstance(result[0], TextContent)
+    data = json.loads(result[0].text)
+    assert len(data) > 0
+    assert any("ssim" in model["key"] for model in data)
+
+def _validate_search_by_type(result):
+    data = json.loads(result[0].text)
+    assert all(model["info"]["type"] == "FR" for model in data)
+
+def _validate_model_info(result):
+    assert len(result) == 1
+    data = json.loads(result[0].text)
+    assert data["type"] == "FR"
+    assert "lpips" in data["names"]
+
+def _validate_model_not_found(result):
+    assert "not found" in result[0].text
+
+def _validate_all_model_names(result):
+    names = json.loads(result[0].text)
+    assert isinstance(names, list)
+    assert len(names) > 0
+    assert names == model_database.list_model_names("all")
+
+def _validate_fr_model_names(result):
+    fr_names = json.loads(result[0].text)
+    assert fr_names == model_database.list_model_names("FR")
+    names = model_database.list_model_names("all")
+    assert all(name in names for name in fr_names)
+
+def _validate_usage_example(result):
+    assert len(result) == 1
+    example = result[0].text
+    assert "import pyiqa" in example
+    assert "ssim" in example
+    assert "metric = pyiqa.create_metric('ssim')" in example
+
+CALL_TOOL_CASES = [
+    pytest.param("search_models", {"query": "ssim"}, _validate_search_by_name, id="search_models-by-name"),
+    pytest.param("search_models", {"query": "", "model_type": "FR"}, _validate_search_by_type, id="search_models-by-type"),
+    pytest.param("get_model_info", {"model_name": "lpips"}, _validate_model_info, id="get_model_info-existing"),
+    pytest.param("get_model_info", {"model_name": "non_existent"}, _validate_model_not_found, id="get_model_info-missing"),
+    pytest.param("list_model_names", {}, _validate_all_model_names, id="list_model_names-all"),
+    pytest.param("list_model_names", {"model_type": "FR"}, _validate_fr_model_names, id="list_model_names-fr"),
+    pytest.param("get_usage_example", {"model_name": "ssim"}, _validate_usage_example, id="get_usage_example"),
+]
+
 class TestIQAServer:
     """Test suite for the IQA MCP Server."""
     
@@ -128,55 +197,8 @@ class TestIQAServer:
         assert tool_names == {"search_models", "get_model_info", "list_model_names", "get_usage_example"}
 
     @pytest.mark.asyncio
-    async def test_call_tool_search_models(self, server):
-        """Test the search_models tool."""
-        # Test search by name
-        result = await server.server.call_tool()("search_models", {"query": "ssim"})
-        assert len(result) == 1
-        assert isinstance(result[0], TextContent)
-        data = json.loads(result[0].text)
-        assert len(data) > 0
-        assert any("ssim" in model["key"] for model in data)
-        
-        # Test search by type
-        result = await server.server.call_tool()("search_models", {"query": "", "model_type": "FR"})
-        data = json.loads(result[0].text)
-        assert all(model["info"]["type"] == "FR" for model in data)
-
-    @pytest.mark.asyncio
-    async def test_call_tool_get_model_info(self, server):
-        """Test the get_model_info tool."""
-        # Test existing model
-        result = await server.server.call_tool()("get_model_info", {"model_name": "lpips"})
-        assert len(result) == 1
-        data = json.loads(result[0].text)
-        assert data["type"] == "FR"
-        assert "lpips" in data["names"]
-        
-        # Test non-existent model
-        result = await server.server.call_tool()("get_model_info", {"model_name": "non_existent"})
-        assert "not found" in result[0].text
-
-    @pytest.mark.asyncio
-    async def test_call_tool_list_model_names(self, server):
-        """Test the list_model_names tool."""
-        # Test all models
-        result = await server.server.call_tool()("list_model_names", {})
-        names = json.loads(result[0].text)
-        assert isinstance(names, list)
-        assert len(names) > 0
-        
-        # Test FR models
-        result = await server.server.call_tool()("list_model_names", {"model_type": "FR"})
-        fr_names = json.loads(result[0].text)
-        assert all(name in names for name in fr_names)
-
-    @pytest.mark.asyncio
-    async def test_call_tool_get_usage_example(self, server):
-        """Test the get_usage_example tool."""
-        result = await server.server.call_tool()("get_usage_example", {"model_name": "ssim"})
-        assert len(result) == 1
-        example = result[0].text
-        assert "import pyiqa" in example
-        assert "ssim" in example
-        assert "metric = pyiqa.create_metric('ssim')" in example
+    @pytest.mark.parametrize("tool_name,params,validator", CALL_TOOL_CASES)
+    async def test_call_tool(self, server, tool_name, params, validator):
+        """Test that each tool call returns the expected content."""
+        result = await server.server.call_tool()(tool_name, params)
+        validator(result)